@@ -12,13 +12,15 @@ from .exceptions import ValidationError, ExceptionType
 from .utils import (
     missing, assign_attr_or_item_getter, assign_item_getter,
     LoadResult, DumpResult, BaseResult, no_processing,
+    mark_as_identity, is_identity, ErrorMessageMixin,
     bind_attrs, bind_not_ellipsis_attrs,
 )
 
 
 # type hints
 PartialFields = namedtuple('PartialFields', [
-    'field', 'source', 'target', 'required', 'default', 'field_method'])
+    'source', 'target', 'required', 'required_error', 'required_error_arg',
+    'default', 'default_is_callable', 'field_method'])
 PartialGroups = namedtuple('PartialGroups', [
     'group_method', 'error_key', 'source_target_pairs'])
 
@@ -77,6 +79,23 @@ def _set_fields(cls_or_obj, fields: FieldDict):
     cls_or_obj.fields = fields
 
 
+def _collect_field_error(
+        error: Exception, value, source: str, target: str,
+        valid_data: dict, errors: dict, invalid_data: dict):
+    """Collect error and invalid data of a field into process result."""
+    if isinstance(error, ValidationError) and isinstance(error.detail, BaseResult):
+        detail: BaseResult = error.detail
+        # distribute nested data in BaseResult
+        valid_data[target] = detail.valid_data
+        errors[source] = detail.errors
+        invalid_data[source] = detail.invalid_data
+    else:
+        # collect errors and invalid data
+        errors[source] = error
+        if value is not missing:
+            invalid_data[source] = value
+
+
 class CatalystMeta(type):
     """Metaclass for `Catalyst` class. Binds fields to `fields` attribute."""
 
@@ -97,6 +116,10 @@ class Catalyst(CatalystABC, metaclass=CatalystMeta):
     The available params are `schema`, `raise_error`, `all_errors`,
     `except_exception`, `process_aliases`, `DumpResult` and `LoadResult`.
 
+    The options and fields are resolved into processors when initializing
+    for shorter run time, so reassigning them on the instance afterwards
+    takes no effect. Create a new instance with the options instead.
+
     :param schema: A dict or instance or class which contains fields. This
         is a convenient way to avoid name clashes when fields are Python
         keywords or conflict with other attributes.
@@ -154,6 +177,10 @@ class Catalyst(CatalystABC, metaclass=CatalystMeta):
     dump_result_class = DumpResult
     load_result_class = LoadResult
 
+    # generate code for processing fields when initializing,
+    # which is faster but harder to debug
+    compile_on_init = False
+
     fields: FieldDict = {}
 
     # assign getter for dumping & loading
@@ -213,31 +240,34 @@ class Catalyst(CatalystABC, metaclass=CatalystMeta):
             _set_fields(self, fields)
 
         # include fields
+        fields = self.fields
         if include is None:
-            include = self.fields.keys()
-        if dump_include is None:
-            dump_include = include
-        if load_include is None:
-            load_include = include
+            include = fields.keys()
+        dump_include = list(include if dump_include is None else dump_include)
+        load_include = list(include if load_include is None else load_include)
 
         # exclude fields
         exclude = set() if exclude is None else set(exclude)
         dump_exclude = exclude if dump_exclude is None else set(dump_exclude)
         load_exclude = exclude if load_exclude is None else set(load_exclude)
-        if dump_exclude:
-            dump_include = (field for field in dump_include if field not in dump_exclude)
-        if load_exclude:
-            load_include = (field for field in load_include if field not in load_exclude)
-
-        try:
-            self._dump_fields = self._copy_fields(
-                self.fields, dump_include,
-                lambda key: not self.fields[key].no_dump)
-            self._load_fields = self._copy_fields(
-                self.fields, load_include,
-                lambda key: not self.fields[key].no_load)
-        except KeyError as error:
-            raise ValueError(f'Field "{error.args[0]}" does not exist.') from error
+
+        # check in the given order, so that the reported field is deterministic
+        for include_keys, exclude_keys in (
+                (dump_include, dump_exclude), (load_include, load_exclude)):
+            for key in include_keys:
+                if key not in fields and key not in exclude_keys:
+                    raise ValueError(f'Field "{key}" does not exist.')
+
+        dump_include = set(dump_include) - dump_exclude
+        load_include = set(load_include) - load_exclude
+
+        # filter dump and load fields in one pass, following the order of fields
+        self._dump_fields, self._load_fields = {}, {}
+        for key, field in fields.items():
+            if key in dump_include and not field.no_dump:
+                self._dump_fields[key] = field
+            if key in load_include and not field.no_load:
+                self._load_fields[key] = field
 
         # make processors when initializing for shorter run time
         self._do_dump = self._make_processor('dump', False)
@@ -245,16 +275,6 @@ class Catalyst(CatalystABC, metaclass=CatalystMeta):
         self._do_dump_many = self._make_processor('dump', True)
         self._do_load_many = self._make_processor('load', True)
 
-    @staticmethod
-    def _copy_fields(
-            fields: FieldDict, keys: Iterable[str],
-            is_copying: Callable[[str], bool]) -> FieldDict:
-        new_fields = {}
-        for key in keys:
-            if is_copying(key):
-                new_fields[key] = fields[key]
-        return new_fields
-
     @staticmethod
     def _process_one(
             data: Any,
@@ -270,42 +290,46 @@ class Catalyst(CatalystABC, metaclass=CatalystMeta):
         valid_data, errors, invalid_data = {}, {}, {}
 
         # process data for each fields
-        for field, source, target, required, default, field_method in partial_fields:
+        for (source, target, required, required_error, required_error_arg,
+             default, default_is_callable, field_method) in partial_fields:
             value = missing
             try:
                 value = get_value(data, source, missing)
 
                 if value is missing:
-                    value = default() if callable(default) else default
+                    value = default() if default_is_callable else default
 
                 if value is not missing:
                     value = field_method(value)
 
-                if value is missing:
-                    if required:
-                        raise field.error('required')
-                else:
+                if value is not missing:
                     valid_data[target] = value
+                elif required:
+                    raise required_error(required_error_arg)
             except except_exception as e:
-                if isinstance(e, ValidationError) and isinstance(e.detail, BaseResult):
-                    detail: BaseResult = e.detail
-                    # distribute nested data in BaseResult
-                    valid_data[target] = detail.valid_data
-                    errors[source] = detail.errors
-                    invalid_data[source] = detail.invalid_data
-                else:
-                    # collect errors and invalid data
-                    errors[source] = e
-                    if value is not missing:
-                        invalid_data[source] = value
+                _collect_field_error(
+                    e, value, source, target, valid_data, errors, invalid_data)
                 if not all_errors:
                     break
 
         # field groups depend on fields, if error occurs, do not continue
-        if errors:
+        if errors or not partial_groups:
             return valid_data, errors, invalid_data
 
-        # process data for each field groups
+        return Catalyst._process_groups(
+            data, valid_data, errors, invalid_data,
+            all_errors, partial_groups, except_exception)
+
+    @staticmethod
+    def _process_groups(
+            data: Any,
+            valid_data: dict,
+            errors: dict,
+            invalid_data: dict,
+            all_errors: bool,
+            partial_groups: Iterable[PartialGroups],
+            except_exception: ExceptionType):
+        """Process one object using field groups, after all fields being processed."""
         for group_method, error_key, source_target_pairs in partial_groups:
             try:
                 valid_data = group_method(valid_data, original_data=data)
@@ -329,14 +353,99 @@ class Catalyst(CatalystABC, metaclass=CatalystMeta):
                     break
         return valid_data, errors, invalid_data
 
+    @staticmethod
+    def _compile_process_one(
+            all_errors: bool,
+            assign_getter: Callable,
+            partial_fields: Iterable[PartialFields],
+            partial_groups: Iterable[PartialGroups],
+            except_exception: ExceptionType) -> Callable:
+        """Generate a function that works the same as `_process_one` with the
+        given arguments. The loop over fields is unrolled into straight-line code,
+        and the options of each field are inlined, such as skipping the default
+        value if it is `missing`.
+        """
+        namespace = {
+            'missing': missing,
+            'assign_getter': assign_getter,
+            'except_exception': except_exception,
+            'collect_field_error': _collect_field_error,
+            'process_groups': partial(
+                Catalyst._process_groups,
+                all_errors=all_errors,
+                partial_groups=partial_groups,
+                except_exception=except_exception),
+        }
+        lines = [
+            'def process_one(data):',
+            '    get_value = assign_getter(data)',
+            '    valid_data, errors, invalid_data = {}, {}, {}',
+        ]
+        for i, (source, target, required, required_error, required_error_arg,
+                default, default_is_callable, field_method) in enumerate(partial_fields):
+            # bind the arguments of each field to variables
+            namespace.update({
+                f'required_error_{i}': required_error,
+                f'required_error_arg_{i}': required_error_arg,
+                f'source_{i}': source,
+                f'target_{i}': target,
+                f'default_{i}': default,
+                f'field_method_{i}': field_method,
+            })
+            lines.append('    value = missing')
+            lines.append('    try:')
+            lines.append(f'        value = get_value(data, source_{i}, missing)')
+            if default is not missing:
+                lines.append('        if value is missing:')
+                if default_is_callable:
+                    lines.append(f'            value = default_{i}()')
+                else:
+                    lines.append(f'            value = default_{i}')
+            lines.append('        if value is not missing:')
+            lines.append(f'            value = field_method_{i}(value)')
+            lines.append('        if value is not missing:')
+            lines.append(f'            valid_data[target_{i}] = value')
+            if required:
+                lines.append('        else:')
+                lines.append(f'            raise required_error_{i}(required_error_arg_{i})')
+            lines.append('    except except_exception as e:')
+            lines.append(
+                f'        collect_field_error(e, value, source_{i}, target_{i}, '
+                'valid_data, errors, invalid_data)')
+            if not all_errors:
+                lines.append('        return valid_data, errors, invalid_data')
+
+        # field groups depend on fields, if error occurs, do not continue
+        if partial_groups:
+            lines.append('    if errors:')
+            lines.append('        return valid_data, errors, invalid_data')
+            lines.append('    return process_groups(data, valid_data, errors, invalid_data)')
+        else:
+            lines.append('    return valid_data, errors, invalid_data')
+
+        # wrap the function with a factory, so that the bound arguments are
+        # accessed as closure variables, which is faster than global variables,
+        # the namespace is passed as one dict to avoid the limit of 255 arguments
+        lines = ['def make_process_one(namespace):'] + [
+            f'    {key} = namespace[{key!r}]' for key in namespace] + [
+            f'    {line}' for line in lines] + ['    return process_one']
+        source = '\n'.join(lines)
+        factory_namespace = {}
+        # the source is generated from trusted field arguments only, never from input data
+        exec(compile(source, '<catalyst process_one>', 'exec'), factory_namespace)  # pylint: disable=exec-used
+        process_one = factory_namespace['make_process_one'](namespace)
+        return process_one
+
     @staticmethod
     def _process_many(data: Iterable, all_errors: bool, process_one: Callable):
         """Process multiple objects using fields and catalyst options."""
         valid_data, errors, invalid_data = [], {}, {}
+        # bind to local variable for faster access in loop
+        append_valid_data = valid_data.append
         for i, item in enumerate(data):
-            result = process_one(item, raise_error=False)
-            valid_data.append(result.valid_data)
-            if not result.is_valid:
+            result = process_one(item, False)
+            append_valid_data(result.valid_data)
+            if result.errors:
                 errors[i] = result.errors
                 invalid_data[i] = result.invalid_data
                 if not all_errors:
@@ -389,6 +498,9 @@ class Catalyst(CatalystABC, metaclass=CatalystMeta):
                     # get partial arguments from FieldGroup
                     group: FieldGroup = field
                     group_method = getattr(group, method_name)
+                    # skip the group if it does nothing
+                    if is_identity(group_method):
+                        continue
                     group_method = self._modify_processer_parameters(group_method)
                     error_key = getattr(group, source_attr)
                     source_target_pairs = []
@@ -406,25 +518,48 @@ class Catalyst(CatalystABC, metaclass=CatalystMeta):
                     required = getattr(field, required_attr)
                     if required is None:
                         required = general_required
+                    if type(field).error is not ErrorMessageMixin.error:
+                        # respect the overridden `error` method
+                        required_error, required_error_arg = field.error, 'required'
+                    elif required:
+                        # format message in advance, instead of formatting it every time
+                        required_error = field.error_cls
+                        required_error_arg = field.get_error_message('required')
+                    else:
+                        required_error = required_error_arg = None
                     default = getattr(field, default_attr)
                     if default is ...:
                         default = general_default
-                    partial_fields.append(
-                        PartialFields(field, source, target, required, default, field_method))
-            main_process = partial(
-                self._process_one,
-                all_errors=all_errors,
-                assign_getter=assign_getter,
-                partial_fields=partial_fields,
-                partial_groups=partial_groups,
-                except_exception=except_exception)
+                    partial_fields.append(PartialFields(
+                        source, target, required, required_error, required_error_arg,
+                        default, callable(default), field_method))
+            # freeze the arguments, they never change after initialization
+            partial_fields, partial_groups = tuple(partial_fields), tuple(partial_groups)
+            if self.compile_on_init:
+                main_process = self._compile_process_one(
+                    all_errors=all_errors,
+                    assign_getter=assign_getter,
+                    partial_fields=partial_fields,
+                    partial_groups=partial_groups,
+                    except_exception=except_exception)
+            else:
+                # use closure rather than `partial` with keyword arguments,
+                # which creates a new dict to merge the arguments for each call
+                process_one = self._process_one
+
+                def main_process(data):
+                    return process_one(
+                        data, all_errors, assign_getter,
+                        partial_fields, partial_groups, except_exception)
 
         # assign params as closure variables for processor
         pre_process_name = f'pre_{method_name}'
         post_process_name = f'post_{method_name}'
-        pre_process = getattr(self, pre_process_name)
-        post_process = getattr(self, post_process_name)
-        post_process = self._modify_processer_parameters(post_process)
+        # skip pre and post processes which are not overridden
+        pre_process = self._get_overridden_method(pre_process_name)
+        post_process = self._get_overridden_method(post_process_name)
+        if post_process is not None:
+            post_process = self._modify_processer_parameters(post_process)
         process_aliases = self.process_aliases
         default_raise_error = self.raise_error
 
@@ -435,15 +570,17 @@ class Catalyst(CatalystABC, metaclass=CatalystMeta):
 
             try:
                 # pre process
-                process_name = pre_process_name
-                valid_data = pre_process(data)
+                valid_data = data
+                if pre_process is not None:
+                    process_name = pre_process_name
+                    valid_data = pre_process(data)
 
                 # main process
                 process_name = method_name
                 valid_data, errors, invalid_data = main_process(valid_data)
 
                 # post process
-                if not errors:
+                if not errors and post_process is not None:
                     process_name = post_process_name
                     valid_data = post_process(valid_data, original_data=data)
             except except_exception as e:
@@ -458,11 +595,20 @@ class Catalyst(CatalystABC, metaclass=CatalystMeta):
 
             result = result_class(valid_data, errors, invalid_data)
             if errors and raise_error:
-                raise ValidationError(msg=result.format_errors(), detail=result)
+                raise ValidationError(detail=result)
             return result
 
         return integrated_process
 
+    def _get_overridden_method(self, name: str):
+        """Get the bound method by `name`, return `None`
+        if it is an identity process which is not overridden.
+        """
+        method = getattr(self, name)
+        if is_identity(method):
+            return None
+        return method
+
     def _modify_processer_parameters(self, func):
         """Modify the parameters of the processer function.
         Ignore `original_data` if it's not one of the parameters.
@@ -488,7 +634,37 @@ class Catalyst(CatalystABC, metaclass=CatalystMeta):
             result = processor(ba.arguments, raise_error=True)
             ba.arguments.update(result.valid_data)
             return func(*ba.args, **ba.kwargs)
-        return wrapper
+
+        params = sig.parameters.values()
+        if any(param.kind is not param.POSITIONAL_OR_KEYWORD for param in params):
+            return wrapper
+
+        # bind arguments without `sig.bind` if all parameters are positional or keyword,
+        # which is much faster, and fall back to `wrapper` to raise error for invalid arguments
+        names = tuple(sig.parameters)
+        name_set = frozenset(names)
+        required = frozenset(param.name for param in params if param.default is param.empty)
+        @wraps(func)
+        def simple_wrapper(*args, **kwargs):
+            arguments = dict(zip(names, args))
+            arguments.update(kwargs)
+            if (len(args) > len(names)
+                    or len(arguments) != len(args) + len(kwargs)
+                    or not name_set.issuperset(arguments)
+                    or not required.issubset(arguments)):
+                return wrapper(*args, **kwargs)
+            result = processor(arguments, raise_error=True)
+            arguments.update(result.valid_data)
+            # pass the leading present arguments positionally, and the rest by keyword,
+            # the same as `BoundArguments.args` and `BoundArguments.kwargs`
+            args = []
+            for name in names:
+                if name not in arguments:
+                    break
+                args.append(arguments[name])
+            kwargs = {name: arguments[name] for name in names[len(args):] if name in arguments}
+            return func(*args, **kwargs)
+        return simple_wrapper
 
     def dump(self, data: Any, raise_error: bool = None) -> DumpResult:
         """Serialize `data` according to defined fields."""
@@ -515,26 +691,34 @@ class Catalyst(CatalystABC, metaclass=CatalystMeta):
         return self._process_args(func, self.load)
 
     # pre and post processes
+    @mark_as_identity
     def pre_dump(self, data):
         return data
 
+    @mark_as_identity
     def post_dump(self, data, original_data=None):
         return data
 
+    @mark_as_identity
     def pre_load(self, data):
         return data
 
+    @mark_as_identity
     def post_load(self, data, original_data=None):
         return data
 
+    @mark_as_identity
     def pre_dump_many(self, data):
         return data
 
+    @mark_as_identity
     def post_dump_many(self, data, original_data=None):
         return data
 
+    @mark_as_identity
     def pre_load_many(self, data):
         return data
 
+    @mark_as_identity
     def post_load_many(self, data, original_data=None):
         return data
@@ -8,16 +8,30 @@ class ValidationError(Exception):
     """Raised when validation fails on a field or catalyst.
 
     :param msg: An error message, list of error messages, or dict of
-        error messages.
+        error messages. If `None` and `detail` has `format_errors` method,
+        such as `DumpResult` and `LoadResult`, the message will be generated
+        from `detail` when it is accessed for the first time. Since nested
+        errors are usually collected by `detail`, this avoids formatting
+        messages which are never used.
     :param detail: A `DumpResult`, `LoadResult`, or any information
         about the error detail.
     """
 
-    def __init__(self, msg, detail=None):
+    def __init__(self, msg=None, detail=None):
         super().__init__()
-        self.msg = msg
+        self._msg = msg
         self.detail = detail
 
+    @property
+    def msg(self):
+        if self._msg is None and hasattr(self.detail, 'format_errors'):
+            self._msg = self.detail.format_errors()
+        return self._msg
+
+    @msg.setter
+    def msg(self, msg):
+        self._msg = msg
+
     def __repr__(self):
         return f'ValidationError({self.msg!r})'
 
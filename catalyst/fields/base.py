@@ -4,7 +4,7 @@ from functools import partial
 from typing import Any, Iterable, Union, Dict, Callable as CallableType
 
 from ..utils import (
-    ErrorMessageMixin, missing, no_processing,
+    ErrorMessageMixin, missing, no_processing, is_identity,
     bind_attrs, bind_not_ellipsis_attrs,
 )
 from ..validators import MemberValidator, NonMemberValidator
@@ -240,15 +240,21 @@ class Field(BaseField):
     @staticmethod
     def ensure_validators(validators: MultiValidator) -> list:
         """Make sure validators are callables."""
-        if not isinstance(validators, Iterable):
-            validators = [validators]
-
+        if validators is None:
+            return []
+        if callable(validators):
+            return [validators]
+
+        msg = ('Argument "validators" must be ether Callable '
+               'or Iterable which contained Callable.')
+        try:
+            validators = list(validators)
+        except TypeError as error:
+            raise TypeError(msg) from error
         for v in validators:
             if not callable(v):
-                raise TypeError(
-                    'Argument "validators" must be ether Callable '
-                    'or Iterable which contained Callable.')
-        return list(validators)
+                raise TypeError(msg)
+        return validators
 
     def set_validators(self, validators: MultiValidator):
         """Replace all validators."""
@@ -275,7 +281,11 @@ class Field(BaseField):
     validate_load = validate
 
     def is_none(self, value):
-        return any(value == none for none in self.as_none)
+        # explicit loop is faster than `any` with generator expression
+        for none in self.as_none:
+            if value == none:
+                return True
+        return False
 
     def format(self, value):
         return value
@@ -285,7 +295,10 @@ class Field(BaseField):
         formatting. By default, it doesn't validate `value` during dumping,
         but you can override `validate_dump` method to perform validation.
         """
-        self.validate_dump(value)
+        # skip calling `validate_dump` if it is not overridden
+        validate_dump = self.validate_dump
+        if not is_identity(validate_dump):
+            validate_dump(value)
 
         if self.is_none(value):
             value = self.dump_none
@@ -65,14 +65,15 @@ class ListField(Field):
             process_one: CallableType,
             except_exception: ExceptionType):
         valid_data, errors, invalid_data = [], {}, {}
+        # bind to local variable for faster access in loop
+        append_valid_data = valid_data.append
         for i, item in enumerate(data):
             try:
-                result = process_one(item)
-                valid_data.append(result)
+                append_valid_data(process_one(item))
             except except_exception as e:
                 if isinstance(e, ValidationError) and isinstance(e.detail, BaseResult):
                     # distribute nested data in BaseResult
-                    valid_data.append(e.detail.valid_data)
+                    append_valid_data(e.detail.valid_data)
                     errors[i] = e.detail.errors
                     invalid_data[i] = e.detail.invalid_data
                 else:
@@ -82,7 +83,7 @@ class ListField(Field):
                     break
         if errors:
             result = BaseResult(valid_data, errors, invalid_data)
-            raise ValidationError(msg=result.format_errors(), detail=result)
+            raise ValidationError(detail=result)
         return valid_data
 
 
@@ -147,7 +148,7 @@ class NestedField(Field):
             self._do_load = catalyst.load
 
     def format(self, value):
-        return self._do_dump(value, raise_error=True).valid_data
+        return self._do_dump(value, True).valid_data
 
     def parse(self, value):
-        return self._do_load(value, raise_error=True).valid_data
+        return self._do_load(value, True).valid_data
@@ -1,4 +1,4 @@
-from typing import Iterable, Mapping, Hashable, Callable as CallableType
+from typing import Iterable, Mapping, Callable as CallableType
 
 from ..utils import copy_keys, bind_attrs
 from ..validators import LengthValidator, RegexValidator
@@ -71,8 +71,11 @@ class BooleanField(Field):
             for raw in raw_values}
 
     def format(self, value):
-        if isinstance(value, Hashable):
+        # checking `Hashable` is much slower than catching unhashable error
+        try:
             value = self.reverse_value_map.get(value, value)
+        except TypeError:
+            pass
         return bool(value)
 
     parse = format
@@ -4,7 +4,7 @@ from typing import Callable, Iterable
 from functools import partial
 
 from .fields import BaseField, Field, FieldDict, NestedField, NumberField
-from .utils import bind_attrs
+from .utils import bind_attrs, mark_as_identity
 
 
 class FieldGroup(BaseField):
@@ -54,10 +54,12 @@ class FieldGroup(BaseField):
         """
         return self.override_method(func, 'load', obj_name, **kwargs)
 
+    @mark_as_identity
     def dump(self, data: dict, original_data=None):
         """Serialize multiple fields of the data."""
         return data
 
+    @mark_as_identity
     def load(self, data: dict, original_data=None):
         """Deserialize multiple fields of the data."""
         return data
@@ -62,8 +62,11 @@ class ErrorMessageMixin:
         """
         messages = {}
         for cls in reversed(self.__class__.__mro__):
-            messages.update(cls.__dict__.get('error_messages', {}))
-        messages.update(error_messages or {})
+            cls_messages = cls.__dict__.get('error_messages')
+            if cls_messages:
+                messages.update(cls_messages)
+        if error_messages:
+            messages.update(error_messages)
         self.error_messages: Dict[str, str] = messages
 
     def get_error_message(self, error_key: str, **kwargs):
@@ -124,18 +127,45 @@ which can provides type hints without specifying the actual default value.
 """
 
 
+def get_item(mapping: Mapping, key, default=None):
+    """Same as `dict.get`, but works with any `Mapping`."""
+    return mapping.get(key, default)
+
+
 def assign_attr_or_item_getter(obj):
-    if isinstance(obj, Mapping):
+    """Assign a getter according to the type of `obj`. The getter has the same
+    signature as `getattr`, so that checking type once is enough for each object.
+    """
+    if isinstance(obj, dict):
         return dict.get
+    if isinstance(obj, Mapping):
+        return get_item
     return getattr
 
 
 def assign_item_getter(obj):
-    if isinstance(obj, Mapping):
+    """Similar to `assign_attr_or_item_getter`, but `obj` must be `Mapping`."""
+    if isinstance(obj, dict):
         return dict.get
+    if isinstance(obj, Mapping):
+        return get_item
     raise TypeError(f'"{obj}" is not Mapping.')
 
 
+def mark_as_identity(func):
+    """Mark `func` as a process which returns data without processing,
+    so that it is safe for the caller to skip it."""
+    func._is_identity = True
+    return func
+
+
+def is_identity(func) -> bool:
+    """Whether `func` is marked by `mark_as_identity`. Bound methods are
+    also supported since they delegate attribute access to functions."""
+    return getattr(func, '_is_identity', False) is True
+
+
+@mark_as_identity
 def no_processing(value):
     return value
 
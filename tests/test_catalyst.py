@@ -1,9 +1,12 @@
+from functools import wraps
+from types import MappingProxyType
 from unittest import TestCase
 
 from catalyst.base import CatalystABC
 from catalyst.core import Catalyst
 from catalyst.fields import Field, StringField, IntegerField, \
     FloatField, BooleanField, CallableField, ListField, NestedField
+from catalyst.groups import CompareFields
 from catalyst.exceptions import ValidationError
 from catalyst.utils import missing
 
@@ -232,6 +235,11 @@ class CatalystTest(TestCase):
         self.assertDictEqual(
             catalyst.load(load_data).valid_data, {'string': 'xxx'})
 
+        # fields follow the order of declaration, not the order of `include`
+        catalyst = TestDataCatalyst(include=['integer', 'string'])
+        self.assertListEqual(list(catalyst._dump_fields), ['string', 'integer'])
+        self.assertListEqual(list(catalyst._load_fields), ['string', 'integer'])
+
         # `dump_include` takes precedence over `include`
         catalyst = TestDataCatalyst(include=['string'], dump_include=['bool_field'])
         self.assertDictEqual(
@@ -281,6 +289,13 @@ class CatalystTest(TestCase):
             TestDataCatalyst(dump_include=['wrong_name'])
         with self.assertRaises(ValueError):
             TestDataCatalyst(load_include=['wrong_name'])
+        # report the first wrong name in the given order
+        with self.assertRaises(ValueError) as ctx:
+            TestDataCatalyst(include=['wrong_1', 'wrong_2', 'wrong_3'])
+        self.assertEqual(str(ctx.exception), 'Field "wrong_1" does not exist.')
+        with self.assertRaises(ValueError) as ctx:
+            TestDataCatalyst(dump_include=['string'], load_include=['wrong_1'])
+        self.assertEqual(str(ctx.exception), 'Field "wrong_1" does not exist.')
 
         # ignore wrong `exclude`
         TestDataCatalyst(exclude=['wrong_name'])
@@ -308,6 +323,11 @@ class CatalystTest(TestCase):
             test_catalyst.dump(dump_data_dict).valid_data,
             result.valid_data)
 
+        # dump from mapping which is not dict
+        self.assertEqual(
+            test_catalyst.dump(MappingProxyType(dump_data_dict)).valid_data,
+            result.valid_data)
+
         # test load
         load_data = {
             'string': 'xxx', 'integer': 1, 'float': 1.1,
@@ -323,6 +343,10 @@ class CatalystTest(TestCase):
         self.assertFalse(result.invalid_data)
         self.assertDictEqual(result.valid_data, load_result)
 
+        result = test_catalyst.load(MappingProxyType(load_data))
+        self.assertTrue(result.is_valid)
+        self.assertDictEqual(result.valid_data, load_result)
+
         # test invalid data: wrong type
         result = test_catalyst.load(1)
         self.assertFalse(result.is_valid)
@@ -365,6 +389,9 @@ class CatalystTest(TestCase):
         with self.assertRaises(ValidationError) as ctx:
             test_catalyst.load(invalid_data, raise_error=True)
         self.assertEqual(set(ctx.exception.detail.errors), {'string', 'integer', 'float'})
+        # error message is generated from detail lazily
+        self.assertDictEqual(ctx.exception.msg, ctx.exception.detail.format_errors())
+        self.assertEqual(str(ctx.exception), str(ctx.exception.detail.format_errors()))
 
         catalyst_2 = TestDataCatalyst(all_errors=False)
         result = catalyst_2.load(invalid_data, raise_error=False)
@@ -392,6 +419,24 @@ class CatalystTest(TestCase):
         result = cm.exception.detail
         self.assertIn('required', str(result.errors['a']))
 
+        # respect overridden `error` method of field
+        class NamedErrorField(IntegerField):
+            def error(self, error_key, **kwargs):
+                e = super().error(error_key, **kwargs)
+                e.field = self.name
+                return e
+
+        class Compiled(Catalyst):
+            compile_on_init = True
+
+        for catalyst_class in (Catalyst, Compiled):
+            field = NamedErrorField(load_required=True)
+            c = catalyst_class({'a': field})
+            field.error_messages['required'] = 'Missing.'
+            result = c.load({})
+            self.assertEqual(result.errors['a'].field, 'a')
+            self.assertEqual(str(result.errors['a']), 'Missing.')
+
     def test_load_and_dump_args(self):
         class Kwargs(Catalyst):
             c = IntegerField()
@@ -431,6 +476,41 @@ class CatalystTest(TestCase):
             func_2('x', 'x', b='3', c='x')
         self.assertEqual(len(ctx.exception.detail.errors), 1)
 
+        # function with simple signature
+        @a.load_args
+        def func_4(a, b=1):
+            return a + b
+
+        self.assertEqual(func_4('1'), 2)
+        self.assertEqual(func_4('1', '2'), 3)
+        self.assertEqual(func_4(b='2', a='1'), 3)
+        with self.assertRaises(ValidationError):
+            func_4('x')
+        # invalid arguments
+        with self.assertRaises(TypeError):
+            func_4()
+        with self.assertRaises(TypeError):
+            func_4(1, 2, 3)
+        with self.assertRaises(TypeError):
+            func_4(1, a=1)
+        with self.assertRaises(TypeError):
+            func_4(1, c=1)
+
+        # function wrapped by decorator which only takes positional arguments
+        def positional_only(f):
+            @wraps(f)
+            def wrapper(*args):
+                return f(*args)
+            return wrapper
+
+        @a.load_args
+        @positional_only
+        def func_5(a, b):
+            return a + b
+
+        self.assertEqual(func_5('1', '2'), 3)
+        self.assertEqual(func_5('1', b='2'), 3)
+
     def test_load_and_dump_many(self):
         class C(Catalyst):
             s = StringField(min_length=1, max_length=2)
@@ -483,6 +563,10 @@ class CatalystTest(TestCase):
         self.assertEqual(set(result.errors), {0})
         self.assertEqual(set(result.errors[0]), {'load'})
 
+        # missing required field
+        result = c.dump_many([{}, {}])
+        self.assertEqual(set(result.errors), {0, 1})
+        self.assertIn('required', str(result.errors[0]['s']))
 
         c = C(process_aliases={'load_many': 'xxx'})
         result = c.load_many(1)
@@ -519,6 +603,11 @@ class CatalystTest(TestCase):
 
         c = C()
 
+        # processes which are not overridden are skipped
+        self.assertIsNone(c._get_overridden_method('pre_dump_many'))
+        self.assertIsNotNone(c._get_overridden_method('pre_load_many'))
+        self.assertIsNotNone(c._get_overridden_method('post_load'))
+
         valid_data = {'max_value': 2, 'min_value': 1}
         # dump valid
         result = c.dump(valid_data)
@@ -596,6 +685,43 @@ class CatalystTest(TestCase):
 
         c.process_aliases.clear()
 
+    def test_compile_on_init(self):
+        class Compiled(TestDataCatalyst):
+            compile_on_init = True
+            comparison = CompareFields('integer', '<', 'float_field')
+
+        class Generic(Compiled):
+            compile_on_init = False
+
+        dump_data = TestData(
+            string='xxx', integer=1, float_=1.1,
+            bool_=True, list_=['a', 'b'])
+        load_data = [
+            {'string': 'xxx', 'integer': 1, 'float': 1.1, 'bool': True, 'list_': ['a', 'b']},
+            {'integer': 1, 'float': 0.5},
+            {'string': 'x', 'integer': 'x', 'float': [], 'list_': [1, []]},
+            {'string': {}},
+        ]
+        for options in ({}, {'all_errors': False}, {'dump_default': None}):
+            compiled, generic = Compiled(**options), Generic(**options)
+            results = [
+                (compiled.dump(dump_data), generic.dump(dump_data)),
+                (compiled.dump({}), generic.dump({})),
+                (compiled.load_many(load_data), generic.load_many(load_data)),
+            ]
+            for a, b in results:
+                self.assertEqual(a.valid_data, b.valid_data)
+                self.assertEqual(a.invalid_data, b.invalid_data)
+                self.assertEqual(a.format_errors(), b.format_errors())
+
+        # more fields than the limit of function arguments in old Python
+        class CompiledCatalyst(Catalyst):
+            compile_on_init = True
+
+        compiled = CompiledCatalyst({f'f{i}': IntegerField() for i in range(50)})
+        data = {f'f{i}': i for i in range(50)}
+        self.assertEqual(compiled.load(data).valid_data, data)
+
     def test_except_exception(self):
         catalyst = Catalyst(
             schema={'a': IntegerField(minimum=0)},
@@ -131,6 +131,11 @@ class FieldTest(TestCase):
         # test wrong args
         with self.assertRaises(TypeError):
             a.field.set_validators(1)
+        with self.assertRaises(TypeError):
+            a.field.set_validators([1])
+        self.assertListEqual(Field.ensure_validators(None), [])
+        self.assertListEqual(Field.ensure_validators(len), [len])
+        self.assertListEqual(Field.ensure_validators((len, str)), [len, str])
         with self.assertRaises(TypeError):
             a.field.add_validator(1)
         with self.assertRaises(TypeError):
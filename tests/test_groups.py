@@ -4,6 +4,7 @@ from catalyst.core import Catalyst
 from catalyst.fields import NestedField, IntegerField, DecimalField, StringField
 from catalyst.groups import FieldGroup, CompareFields, TransformNested, SumFields
 from catalyst.exceptions import ValidationError
+from catalyst.utils import is_identity
 
 
 class GroupsTest(TestCase):
@@ -31,6 +32,10 @@ class GroupsTest(TestCase):
         group.set_fields(fields)
         self.assertSetEqual(set(group.fields), {'xxx', 'num'})
 
+        # identity methods can be skipped by catalyst
+        self.assertTrue(is_identity(group.dump))
+        self.assertTrue(is_identity(group.load))
+
         # test override method
         @group.set_dump
         @group.set_load
@@ -51,6 +56,7 @@ class GroupsTest(TestCase):
             return data
         self.assertEqual(group.dump, self_and_group)
         self.assertEqual(group.dump({})['xxx'], 1)
+        self.assertFalse(is_identity(group.dump))
 
     def test_compare_fields(self):
         class ComparisonCatalyst(Catalyst):
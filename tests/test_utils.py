@@ -1,10 +1,10 @@
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import patch, Mock
 
 from catalyst.exceptions import ValidationError
 from catalyst.utils import (
     snake_to_camel, ErrorMessageMixin, BaseResult,
-    missing
+    missing, mark_as_identity, is_identity, no_processing,
 )
 
 
@@ -71,3 +71,10 @@ class UtilsTest(TestCase):
 
     def test_others(self):
         self.assertEqual(str(missing), '<catalyst.missing>')
+
+    def test_is_identity(self):
+        self.assertTrue(is_identity(no_processing))
+        self.assertTrue(is_identity(mark_as_identity(lambda data: data)))
+        self.assertFalse(is_identity(lambda data: data))
+        # objects which invent attributes are not identity
+        self.assertFalse(is_identity(Mock()))